@@ -7,30 +7,54 @@ Combines multiple CSV mission files and removes duplicates based on ID field.
 import pandas as pd
 import glob
 import os
+import re
 import sys
 from pathlib import Path
 
+# Date folders are named like "Sep 25" or "Oct 3"
+MONTH_ABBREVIATIONS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+# Longest day in each month; Feb 29 is allowed since folder names carry no year
+MONTH_DAYS = [31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+DATE_FOLDER_PATTERN = re.compile(r'^(' + '|'.join(MONTH_ABBREVIATIONS) + r') (\d{1,2})$')
+
+def date_folder_key(name):
+    """
+    Return (month index, day) for a date folder name, or None if it is not a real date.
+
+    Args:
+        name (str): Folder name, e.g. 'Sep 25'
+
+    Returns:
+        tuple: (month_index, day) for sorting, or None
+    """
+    match = DATE_FOLDER_PATTERN.match(name)
+    if not match:
+        return None
+    month_index = MONTH_ABBREVIATIONS.index(match.group(1))
+    day = int(match.group(2))
+    if not 1 <= day <= MONTH_DAYS[month_index]:
+        return None
+    return month_index, day
+
 def get_available_date_folders(base_path='.'):
-    """Get list of available date folders."""
+    """Get list of available date folders, in calendar order."""
     folders = []
     for item in os.listdir(base_path):
         item_path = os.path.join(base_path, item)
-        if os.path.isdir(item_path) and item.startswith('Sep '):
+        if os.path.isdir(item_path) and date_folder_key(item) is not None:
             folders.append(item)
-    return sorted(folders)
+    return sorted(folders, key=date_folder_key)
 
-def combine_mission_files(folder_path='.', output_to_results=True):
+def find_mission_csv_files(folder_path='.'):
     """
-    Combines all CSV files in the specified folder and removes duplicates by ID.
+    Find the mission CSV files in a date folder.
 
     Args:
-        folder_path (str): Path to folder containing CSV files (default: current directory)
-        output_to_results (bool): Whether to save output to results folder
+        folder_path (str): Path to folder containing CSV files
 
     Returns:
-        str: Path to the output file
+        list: Paths of the matching CSV files (empty if none found)
     """
-
     # Find all CSV files with flexible pattern
     csv_patterns = [
         os.path.join(folder_path, "Points Data Sept*.csv"),
@@ -38,12 +62,25 @@ def combine_mission_files(folder_path='.', output_to_results=True):
         os.path.join(folder_path, "*.csv")
     ]
 
-    csv_files = []
     for pattern in csv_patterns:
         files = glob.glob(pattern)
         if files:
-            csv_files = files
-            break
+            return files
+    return []
+
+def combine_mission_files(folder_path='.', output_to_results=True):
+    """
+    Combines all CSV files in the specified folder and removes duplicates by ID.
+
+    Args:
+        folder_path (str): Path to folder containing CSV files (default: current directory)
+        output_to_results (bool): Whether to save output to results folder
+
+    Returns:
+        str: Path to the output file
+    """
+
+    csv_files = find_mission_csv_files(folder_path)
 
     if not csv_files:
         print(f"No CSV files found matching pattern in {folder_path}")
@@ -118,7 +155,7 @@ def combine_mission_files(folder_path='.', output_to_results=True):
 
     # Generate output filename with dynamic date
     folder_name = os.path.basename(folder_path)
-    if folder_name.startswith('Sep '):
+    if date_folder_key(folder_name) is not None:
         # Extract date from folder name (e.g., "Sep 25" -> "Sep25")
         date_part = folder_name.replace(' ', '')
         output_filename = f"Combined_Mission_Data_{date_part}_2025.csv"
@@ -191,7 +228,7 @@ def main():
     available_folders = get_available_date_folders(current_dir)
 
     if not available_folders:
-        print("No date folders found (looking for folders starting with 'Sep ')")
+        print("No date folders found (looking for folders named like 'Sep 25')")
         return
 
     selected_folder = None
@@ -5,6 +5,7 @@ import glob
 import os
 from datetime import datetime
 from collections import Counter
+from path_analysis import analyze_paths, print_path_summary
 
 def comprehensive_analysis():
     # Find all CSV files
@@ -200,6 +201,21 @@ def comprehensive_analysis():
         for status, count in status_counts.items():
             print(f"  Status {status}: {count} points")
 
+    # Robot travel efficiency
+    print()
+    print("ROBOT PATH EFFICIENCY:")
+    print("-" * 50)
+
+    path_legs, path_sessions = analyze_paths(combined_df_clean)
+    print_path_summary(path_sessions)
+    total_traveled = path_sessions['traveled_ft'].sum()
+    total_minimal = path_sessions['minimal_ft'].sum()
+    print(f"Total distance traveled: {total_traveled:,.0f} ft ({total_traveled / 5280:.2f} miles)")
+    if total_traveled > 0:
+        print(f"Overall travel efficiency: {min(total_minimal / total_traveled, 1.0) * 100:.0f}%")
+    print(f"Long detours: {int(path_legs['detour'].sum())}")
+    print(f"Backtracking moves: {int(path_legs['backtrack'].sum())}")
+
     print()
     print("=" * 80)
     print("END OF COMPREHENSIVE ANALYSIS")
@@ -2,6 +2,7 @@
 
 import pandas as pd
 from datetime import datetime, timezone, timedelta
+from path_analysis import analyze_paths
 
 def create_customer_summary():
     # Read the clean combined data
@@ -32,6 +33,11 @@ def create_customer_summary():
     daily_stats['estimated_power_on'] = daily_stats['first_point']
     daily_stats['estimated_power_off'] = daily_stats['last_point'] + shutdown_buffer
 
+    # Travel distance and efficiency per day, from the reconstructed robot paths
+    _, path_sessions = analyze_paths(df)
+    path_sessions['date'] = path_sessions['start'].dt.tz_convert(local_tz).dt.date
+    daily_travel = path_sessions.groupby('date')[['traveled_ft', 'minimal_ft']].sum()
+
     total_points = len(df)
 
     print("=" * 60)
@@ -67,6 +73,10 @@ def create_customer_summary():
         print(f"  Last point collected at {last_point}")
         print(f"  Machine powered off at {power_off}")
         print(f"  Active collection time: {hours} hours {minutes} minutes")
+        if date in daily_travel.index and daily_travel.loc[date, 'traveled_ft'] > 0:
+            traveled = daily_travel.loc[date, 'traveled_ft']
+            efficiency = min(daily_travel.loc[date, 'minimal_ft'] / traveled, 1.0) * 100
+            print(f"  Distance traveled: {traveled / 5280:.2f} miles ({efficiency:.0f}% travel efficiency)")
         print()
 
     # Summary statistics
@@ -77,6 +87,7 @@ def create_customer_summary():
     print(f"Elevation range: 270-275 feet")
     print(f"Data quality: 97.7% (20 duplicates removed from 861 raw points)")
     print(f"Average points per hour: {total_points / ((daily_stats['session_duration'].sum().total_seconds()) / 3600):.0f}")
+    print(f"Total distance traveled: {path_sessions['traveled_ft'].sum() / 5280:.2f} miles")
     print()
     print("* All times shown in Central Daylight Time (CDT)")
     print("* GPS coordinates accurate to 6 decimal places")
@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+Mission Data Diff
+Compares two combined mission outputs (or any two point sets) by 'id' and
+reports added, removed and changed points with the fields that differ.
+"""
+
+import pandas as pd
+import numpy as np
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+from datetime import datetime
+
+CHUNK_ROWS = 250000
+# Inputs up to this many CSV bytes (both files together) are joined in memory
+BUCKET_BYTES = 128 * 1024 * 1024
+NUMERIC_TOLERANCE = 1e-9
+BOOLEAN_SPELLINGS = {'true', 'false'}
+TYPE_SAMPLE_ROWS = 10000
+
+def find_numeric_columns(old_file, new_file, columns):
+    """
+    Find the columns that hold numbers in both files.
+
+    These are read as floats, which parse faster and take far less memory
+    than text. The check uses the first TYPE_SAMPLE_ROWS rows of each file.
+    """
+    numeric = set(columns) - {'id'}
+    for csv_file in (old_file, new_file):
+        sample = pd.read_csv(csv_file, comment='#', usecols=columns, nrows=TYPE_SAMPLE_ROWS)
+        numeric &= {c for c in sample.columns
+                    if pd.api.types.is_numeric_dtype(sample[c]) and not pd.api.types.is_bool_dtype(sample[c])}
+    return [c for c in columns if c in numeric]
+
+def read_options(columns, numeric_columns):
+    """Build read_csv arguments: numeric columns as floats, everything else as text."""
+    dtypes = {c: (np.float64 if c in numeric_columns else str) for c in columns}
+    return {
+        'comment': '#',
+        'usecols': columns,
+        'dtype': dtypes,
+        'keep_default_na': False,
+        'na_values': {c: [''] for c in numeric_columns},
+    }
+
+def read_points(csv_file, columns, options):
+    """Read a whole point file, keeping the first row for each id."""
+    df = pd.read_csv(csv_file, **options)
+    return df[columns].drop_duplicates(subset=['id'], keep='first')
+
+def partition_by_id(csv_file, bucket_dir, num_buckets, columns, options):
+    """
+    Split a point file into bucket files by a hash of 'id'.
+
+    The file is read in chunks so memory stays bounded by CHUNK_ROWS. Each
+    bucket is a single append-mode file holding one pickled piece per chunk,
+    which is much cheaper to write and re-read than CSV.
+
+    Args:
+        csv_file (str): Input CSV (metadata '#' lines are skipped)
+        bucket_dir (str): Directory for the bucket files
+        num_buckets (int): Number of buckets
+        columns (list): Columns to keep, in output order
+        options (dict): read_csv arguments from read_options
+
+    Returns:
+        int: Number of rows read
+    """
+    rows = 0
+    bucket_files = [open(os.path.join(bucket_dir, f"{bucket}.pkl"), 'ab') for bucket in range(num_buckets)]
+    try:
+        for chunk in pd.read_csv(csv_file, chunksize=CHUNK_ROWS, **options):
+            rows += len(chunk)
+            chunk = chunk[columns]
+            buckets = pd.util.hash_pandas_object(chunk['id'], index=False).to_numpy() % num_buckets
+            order = np.argsort(buckets, kind='stable')
+            bounds = np.searchsorted(buckets[order], np.arange(num_buckets + 1))
+            for bucket in range(num_buckets):
+                if bounds[bucket] < bounds[bucket + 1]:
+                    piece = chunk.iloc[order[bounds[bucket]:bounds[bucket + 1]]]
+                    pickle.dump(piece, bucket_files[bucket], protocol=pickle.HIGHEST_PROTOCOL)
+    finally:
+        for f in bucket_files:
+            f.close()
+    return rows
+
+def read_bucket(bucket_dir, bucket, columns):
+    """Load one bucket, keeping the first row for each id."""
+    pieces = []
+    with open(os.path.join(bucket_dir, f"{bucket}.pkl"), 'rb') as f:
+        while True:
+            try:
+                pieces.append(pickle.load(f))
+            except EOFError:
+                break
+    if not pieces:
+        return pd.DataFrame(columns=columns, dtype=str)
+    df = pd.concat(pieces, ignore_index=True)
+    return df.drop_duplicates(subset=['id'], keep='first')
+
+def iter_bucket_pairs(old_file, new_file, columns, work_dir):
+    """
+    Yield matching (old, new) slices of the two inputs, split on 'id'.
+
+    Inputs that fit in BUCKET_BYTES are read and yielded whole. Larger inputs
+    are hash-partitioned to disk and yielded one bucket pair at a time.
+    """
+    total_bytes = os.path.getsize(old_file) + os.path.getsize(new_file)
+    num_buckets = max(1, int(np.ceil(total_bytes / BUCKET_BYTES)))
+    numeric_columns = find_numeric_columns(old_file, new_file, columns)
+    old_dir = os.path.join(work_dir, 'old')
+    new_dir = os.path.join(work_dir, 'new')
+
+    # A column that looked numeric may hold text further down; fall back to text
+    for attempt_columns in (numeric_columns, []):
+        options = read_options(columns, attempt_columns)
+        try:
+            if num_buckets == 1:
+                old_df = read_points(old_file, columns, options)
+                new_df = read_points(new_file, columns, options)
+            else:
+                shutil.rmtree(old_dir, ignore_errors=True)
+                shutil.rmtree(new_dir, ignore_errors=True)
+                os.makedirs(old_dir)
+                os.makedirs(new_dir)
+                old_rows = partition_by_id(old_file, old_dir, num_buckets, columns, options)
+                new_rows = partition_by_id(new_file, new_dir, num_buckets, columns, options)
+            break
+        except ValueError:
+            if not attempt_columns:
+                raise
+            print("Some numeric columns contain text; comparing all fields as text")
+
+    if num_buckets == 1:
+        print(f"Loaded {len(old_df)} points from {old_file}")
+        print(f"Loaded {len(new_df)} points from {new_file}")
+        yield old_df, new_df
+        return
+
+    print(f"Loaded {old_rows} rows from {old_file}")
+    print(f"Loaded {new_rows} rows from {new_file}")
+    print(f"Comparing in {num_buckets} buckets")
+
+    for bucket in range(num_buckets):
+        yield read_bucket(old_dir, bucket, columns), read_bucket(new_dir, bucket, columns)
+
+def values_differ(old_values, new_values):
+    """
+    Compare two columns of text values.
+
+    Float columns, and text that parses as numbers on both sides, are compared
+    numerically, so '273.60' and '273.6' match. Boolean spellings such as
+    'true' and 'True' match. Any other text is compared exactly after
+    stripping whitespace. Only values whose raw text differs go through the
+    slower text checks.
+    """
+    if pd.api.types.is_float_dtype(old_values) and pd.api.types.is_float_dtype(new_values):
+        old_num = old_values.to_numpy()
+        new_num = new_values.to_numpy()
+        both_missing = np.isnan(old_num) & np.isnan(new_num)
+        with np.errstate(invalid='ignore'):
+            return ~both_missing & ~(np.abs(old_num - new_num) <= NUMERIC_TOLERANCE)
+
+    old_values = old_values.astype(str)
+    new_values = new_values.astype(str)
+    differs = old_values.to_numpy() != new_values.to_numpy()
+    if not differs.any():
+        return differs
+
+    old_text = old_values[differs].str.strip()
+    new_text = new_values[differs].str.strip()
+    old_num = pd.to_numeric(old_text, errors='coerce').to_numpy(dtype=float)
+    new_num = pd.to_numeric(new_text, errors='coerce').to_numpy(dtype=float)
+    both_numeric = ~np.isnan(old_num) & ~np.isnan(new_num)
+    numeric_differs = np.abs(old_num - new_num) > NUMERIC_TOLERANCE
+
+    old_lower = old_text.str.lower()
+    new_lower = new_text.str.lower()
+    both_boolean = (old_lower.isin(BOOLEAN_SPELLINGS) & new_lower.isin(BOOLEAN_SPELLINGS)).to_numpy()
+    text_differs = np.where(both_boolean,
+                            old_lower.to_numpy() != new_lower.to_numpy(),
+                            old_text.to_numpy() != new_text.to_numpy())
+
+    differs[differs] = np.where(both_numeric, numeric_differs, text_differs)
+    return differs
+
+def format_reported_values(values):
+    """
+    Turn compared values back into the text they had in the source file.
+
+    Columns read as floats print whole numbers without '.0' and other numbers
+    in their shortest exact form, so 31543 stays '31543' and
+    42.99971969986791 is not rounded. Missing numbers become ''.
+    """
+    if not pd.api.types.is_float_dtype(values):
+        return values
+    return values.map(lambda v: '' if np.isnan(v) else str(int(v)) if v.is_integer() and abs(v) < 1e15 else repr(v))
+
+def diff_bucket(old_df, new_df, compare_columns):
+    """
+    Hash-join one bucket on 'id' and describe every difference.
+
+    The old ids are built into a hash index once and every new id is probed
+    against it, so the join needs no sort of the keys.
+
+    Returns:
+        pd.DataFrame: One row per added or removed point and one row per
+        changed field, sorted by id, with columns id, change, field,
+        old_value, new_value
+    """
+    old_positions = pd.Index(old_df['id']).get_indexer(new_df['id'])
+    matched = old_positions >= 0
+
+    old_hit = np.zeros(len(old_df), dtype=bool)
+    old_hit[old_positions[matched]] = True
+
+    removed = pd.DataFrame({'id': old_df['id'].to_numpy()[~old_hit], 'change': 'removed'})
+    added = pd.DataFrame({'id': new_df['id'].to_numpy()[~matched], 'change': 'added'})
+
+    old_both = old_df.iloc[old_positions[matched]].reset_index(drop=True)
+    new_both = new_df[matched].reset_index(drop=True)
+    changes = []
+    for column in compare_columns:
+        old_values = old_both[column]
+        new_values = new_both[column]
+        differs = values_differ(old_values, new_values)
+        if differs.any():
+            changes.append(pd.DataFrame({
+                'id': new_both['id'][differs],
+                'change': 'changed',
+                'field': column,
+                'old_value': format_reported_values(old_values[differs]),
+                'new_value': format_reported_values(new_values[differs]),
+            }))
+
+    # Only the differences are sorted, not the whole join
+    diff = pd.concat([removed, added] + changes, ignore_index=True)
+    return diff.sort_values('id', kind='stable', ignore_index=True)
+
+def diff_mission_data(old_file, new_file, output_to_results=True, compare_columns=None):
+    """
+    Diff two point files keyed on 'id'.
+
+    Inputs that fit in memory are joined directly. Larger inputs are
+    hash-partitioned on 'id' into bucket files and each pair of buckets is
+    hash-joined on its own, so memory is bounded by the bucket size rather
+    than the input size.
+
+    Args:
+        old_file (str): Previous combined output or point set
+        new_file (str): New combined output or point set
+        output_to_results (bool): Whether to save the diff to the results folder
+        compare_columns (list): Fields to compare (default: all shared columns)
+
+    Returns:
+        dict: Counts of added, removed and changed points and the output path
+    """
+    old_columns = list(pd.read_csv(old_file, comment='#', nrows=0).columns)
+    new_columns = list(pd.read_csv(new_file, comment='#', nrows=0).columns)
+    if 'id' not in old_columns or 'id' not in new_columns:
+        print("Both files need an 'id' column to be compared.")
+        return None
+
+    shared = [c for c in old_columns if c in new_columns and c != 'id']
+    if compare_columns is None:
+        compare_columns = shared
+    else:
+        compare_columns = [c for c in compare_columns if c in shared]
+    columns = ['id'] + compare_columns
+
+    only_old = [c for c in old_columns if c not in new_columns]
+    only_new = [c for c in new_columns if c not in old_columns]
+    if only_old:
+        print(f"Columns only in old file (not compared): {', '.join(only_old)}")
+    if only_new:
+        print(f"Columns only in new file (not compared): {', '.join(only_new)}")
+
+    work_dir = tempfile.mkdtemp(prefix='mission_diff_')
+
+    output_file = None
+    if output_to_results:
+        os.makedirs('results', exist_ok=True)
+        output_file = f'results/Mission_Data_Diff_{datetime.now().strftime("%b%d_%Y")}.csv'
+
+    counts = {'added': 0, 'removed': 0, 'changed': 0}
+    field_counts = {}
+    samples = []
+
+    try:
+        diff_file = os.path.join(work_dir, 'diff.csv')
+        header_written = False
+        for old_df, new_df in iter_bucket_pairs(old_file, new_file, columns, work_dir):
+            bucket_diff = diff_bucket(old_df, new_df, compare_columns)
+            if bucket_diff.empty:
+                continue
+
+            bucket_diff = bucket_diff.reindex(columns=['id', 'change', 'field', 'old_value', 'new_value'])
+            counts['added'] += int((bucket_diff['change'] == 'added').sum())
+            counts['removed'] += int((bucket_diff['change'] == 'removed').sum())
+            changed = bucket_diff[bucket_diff['change'] == 'changed']
+            counts['changed'] += changed['id'].nunique()
+            for field, count in changed['field'].value_counts().items():
+                field_counts[field] = field_counts.get(field, 0) + int(count)
+            if len(samples) < 10:
+                samples.extend(bucket_diff.head(10 - len(samples)).itertuples(index=False))
+
+            if output_to_results:
+                bucket_diff.to_csv(diff_file, mode='a', index=False, header=not header_written)
+                header_written = True
+
+        print()
+        print("DIFF SUMMARY:")
+        print("-" * 50)
+        print(f"Points added: {counts['added']}")
+        print(f"Points removed: {counts['removed']}")
+        print(f"Points changed: {counts['changed']}")
+        if field_counts:
+            print(f"Changed fields:")
+            for field, count in sorted(field_counts.items(), key=lambda item: item[1], reverse=True):
+                print(f"  {field}: {count} points")
+
+        if samples:
+            print()
+            print("SAMPLE DIFFERENCES:")
+            print("-" * 50)
+            for row in samples:
+                if row.change == 'changed':
+                    print(f"  {row.id}: {row.field} {row.old_value} -> {row.new_value}")
+                else:
+                    print(f"  {row.id}: {row.change}")
+
+        # Copy the bucket results into the final file under a metadata header
+        if output_to_results:
+            with open(output_file, 'w', newline='') as f:
+                f.write(f"# Mission Data Diff\n")
+                f.write(f"# Old File: {os.path.basename(old_file)}\n")
+                f.write(f"# New File: {os.path.basename(new_file)}\n")
+                f.write(f"# Points Added: {counts['added']}\n")
+                f.write(f"# Points Removed: {counts['removed']}\n")
+                f.write(f"# Points Changed: {counts['changed']}\n")
+                f.write(f"# Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+                f.write("#\n")
+                if header_written:
+                    with open(diff_file) as diff_in:
+                        shutil.copyfileobj(diff_in, f)
+                else:
+                    f.write("id,change,field,old_value,new_value\n")
+            print(f"\nDiff saved to: {output_file}")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    counts['output_file'] = output_file
+    return counts
+
+def main():
+    """Main function to run the script"""
+    print("Mission Data Diff")
+    print("=" * 50)
+
+    if len(sys.argv) < 3:
+        print("Usage: python diff_mission_data.py <old_data.csv> <new_data.csv>")
+        return
+
+    old_file, new_file = sys.argv[1], sys.argv[2]
+    for file in (old_file, new_file):
+        if not os.path.exists(file):
+            print(f"File '{file}' not found.")
+            return
+
+    diff_mission_data(old_file, new_file)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Daily Mission Summary Generator
+Generates a Markdown mission summary for every date folder, processing days
+in parallel and skipping days whose input files have not changed.
+"""
+
+import pandas as pd
+import glob
+import hashlib
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+
+from combine_mission_data import get_available_date_folders, find_mission_csv_files
+
+# Bump when the report layout changes so existing summaries are regenerated
+SUMMARY_FORMAT_VERSION = 1
+FINGERPRINT_PATTERN = re.compile(r'<!-- input-fingerprint: (\w+) -->')
+
+def input_fingerprint(csv_files):
+    """
+    Fingerprint a day's inputs from file names, sizes and modification times.
+
+    Args:
+        csv_files (list): Paths of the day's CSV files
+
+    Returns:
+        str: Hex digest that changes whenever any input file changes
+    """
+    digest = hashlib.sha256(f"format-{SUMMARY_FORMAT_VERSION}".encode())
+    for file in sorted(csv_files):
+        stat = os.stat(file)
+        digest.update(f"{os.path.basename(file)}|{stat.st_size}|{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+def summary_output_path(folder_name, year, results_dir='results'):
+    """Return the summary path for a date folder, e.g. 'Sep 26', 2025 -> Robot_Mission_Summary_Sep26_2025.md."""
+    date_part = folder_name.replace(' ', '')
+    return os.path.join(results_dir, f"Robot_Mission_Summary_{date_part}_{year}.md")
+
+def summary_is_current(folder_name, fingerprint, results_dir='results'):
+    """
+    Check whether a summary for this folder was generated from the same inputs.
+
+    The year in the file name comes from the data, so any year is accepted here.
+    """
+    date_part = folder_name.replace(' ', '')
+    for summary_file in glob.glob(os.path.join(results_dir, f"Robot_Mission_Summary_{date_part}_*.md")):
+        with open(summary_file) as f:
+            match = FINGERPRINT_PATTERN.search(f.read())
+        if match is not None and match.group(1) == fingerprint:
+            return True
+    return False
+
+def format_utc_time(timestamp):
+    """Format a timestamp as ISO text followed by a 12-hour UTC clock time."""
+    iso = timestamp.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z'
+    return f"{iso} ({timestamp.strftime('%I:%M %p').lstrip('0')} UTC)"
+
+def format_values(series):
+    """List the distinct values of a column as readable text."""
+    values = [str(v) for v in series.dropna().unique()]
+    return ', '.join(f'"{v}"' for v in values) if values else 'N/A'
+
+def build_day_summary(folder_name, csv_files, fingerprint):
+    """
+    Build the Markdown summary for one date folder.
+
+    Args:
+        folder_name (str): Date folder name, e.g. 'Sep 26'
+        csv_files (list): Paths of the day's CSV files
+        fingerprint (str): Input fingerprint to embed in the report
+
+    Returns:
+        tuple: (Markdown report, number of unique points, year of the data)
+    """
+    all_dataframes = []
+    read_files = []
+    skipped_files = []
+    for file in csv_files:
+        try:
+            all_dataframes.append(pd.read_csv(file))
+            read_files.append(file)
+        except Exception as e:
+            print(f"Error reading {file}: {e}")
+            skipped_files.append((os.path.basename(file), e))
+
+    if not all_dataframes:
+        raise ValueError(f"No valid CSV files could be read in {folder_name}")
+    combined_df = pd.concat(all_dataframes, ignore_index=True)
+
+    unique_df = combined_df.drop_duplicates(subset=['id'], keep='first')
+    duplicate_ids = combined_df.loc[combined_df.duplicated(subset=['id'], keep=False), 'id'].unique()
+    duplicates_removed = len(combined_df) - len(unique_df)
+
+    times = pd.to_datetime(unique_df['time'])
+    start_time, end_time = times.min(), times.max()
+    duration = end_time - start_time
+    hours = int(duration.total_seconds() // 3600)
+    minutes = int((duration.total_seconds() % 3600) // 60)
+    seconds = int(duration.total_seconds() % 60)
+
+    point_numbers = pd.to_numeric(unique_df['name'], errors='coerce').dropna()
+    point_range = f"{int(point_numbers.min())} to {int(point_numbers.max())}" if len(point_numbers) else 'N/A'
+
+    file_names = sorted(os.path.basename(f) for f in read_files)
+    day_label = start_time.strftime('%B %d, %Y').replace(' 0', ' ')
+    total = len(unique_df)
+
+    lines = [
+        f"# Robot Mission Summary - {day_label}",
+        "",
+        "## Overview",
+        f"This report analyzes the robot's surveying activities on {day_label}, based on "
+        f"{len(read_files)} mission data files containing GPS coordinates and survey points.",
+        "",
+        "## Data Analysis Summary",
+        "",
+        "### Files Processed",
+        f"- **Total Files**: {len(read_files)} CSV files",
+        f"- **File Names**: {', '.join(file_names)}",
+    ]
+    if skipped_files:
+        lines.append(f"- **Skipped Files**: {len(skipped_files)} could not be read")
+        lines += [f"  - {name}: {error}" for name, error in sorted(skipped_files, key=lambda item: item[0])]
+    lines += [
+        f"- **Total Raw Records**: {len(combined_df)} entries across all files",
+        f"- **Unique Mission Points**: {total} (after removing {duplicates_removed} duplicate entries)",
+        "",
+        "### Duplicate Analysis",
+        f"**Duplicate IDs Found**: {len(duplicate_ids)} instances",
+    ]
+    lines += [f"- {dup_id}" for dup_id in sorted(duplicate_ids, key=str.lower)]
+    lines += [
+        "",
+        "### Mission Timeline",
+        f"- **Start Time**: {format_utc_time(start_time)}",
+        f"- **End Time**: {format_utc_time(end_time)}",
+        f"- **Total Mission Duration**: {hours} hours {minutes} minutes and {seconds} seconds",
+        "",
+        "### Survey Coverage",
+        f"- **Point Range**: Survey points numbered from {point_range}",
+        f"- **Point Type**: {format_values(unique_df['description'])} description",
+        f"- **Status**: {format_values(unique_df['status'])}",
+        f"- **Measurement Unit**: {format_values(unique_df['unitOfMeasurement'])}",
+        "",
+        "### Robot Configuration",
+        f"- **Driving Direction**: {format_values(unique_df['drivingDirection'])}",
+        "- **Offset Settings**:",
+        f"  - Left Offset: {format_values(unique_df['roverLeftOffsetDistance'])} ft",
+        f"  - Right Offset: {format_values(unique_df['roverRightOffsetDistance'])} ft",
+        f"  - Front Offset: {format_values(unique_df['roverFrontOffsetDistance'])} ft",
+        f"- **Offset Mode**: {format_values(unique_df['roverOffsetMode'])}",
+        f"- **Manual Marking**: {format_values(unique_df['manualMarking'])}",
+        f"- **Point Completion Status**: {format_values(unique_df['pointCompleted'])}",
+        "",
+        "### Geographic Coverage",
+        f"- **Longitude**: {unique_df['originalLongitude'].min():.6f} to {unique_df['originalLongitude'].max():.6f} degrees",
+        f"- **Latitude**: {unique_df['originalLatitude'].min():.6f} to {unique_df['originalLatitude'].max():.6f} degrees",
+        f"- **Altitude Range**: {unique_df['originalAltitude'].min():.2f} to {unique_df['originalAltitude'].max():.2f} feet",
+        "",
+        "---",
+        f"*Report Generated: {datetime.now().strftime('%B %d, %Y').replace(' 0', ' ')}*",
+        f"*Data Source: {len(read_files)} CSV mission files from {folder_name}*",
+        "",
+        f"<!-- input-fingerprint: {fingerprint} -->",
+        "",
+    ]
+    return '\n'.join(lines), total, start_time.year
+
+def generate_day_summary(folder_path, csv_files, results_dir, fingerprint):
+    """
+    Worker entry point: write the summary for one date folder.
+
+    Runs in a separate process, so it takes only plain arguments and returns
+    a plain result tuple.
+
+    Returns:
+        tuple: (folder name, output file, number of unique points)
+    """
+    folder_name = os.path.basename(folder_path)
+    report, unique_points, year = build_day_summary(folder_name, csv_files, fingerprint)
+    output_file = summary_output_path(folder_name, year, results_dir)
+    with open(output_file, 'w') as f:
+        f.write(report)
+    return folder_name, output_file, unique_points
+
+def generate_daily_summaries(base_path='.', results_dir='results', force=False, max_workers=None):
+    """
+    Generate a Markdown summary for every date folder.
+
+    Args:
+        base_path (str): Directory containing the date folders
+        results_dir (str): Where the summaries are written
+        force (bool): Regenerate summaries even if their inputs are unchanged
+        max_workers (int): Worker processes to use (default: one per CPU)
+
+    Returns:
+        list: Paths of the summaries written in this run
+    """
+    folders = get_available_date_folders(base_path)
+    if not folders:
+        print("No date folders found (looking for folders named like 'Sep 25')")
+        return []
+
+    results_path = os.path.join(base_path, results_dir)
+    os.makedirs(results_path, exist_ok=True)
+
+    pending = []
+    for folder_name in folders:
+        folder_path = os.path.join(base_path, folder_name)
+        csv_files = find_mission_csv_files(folder_path)
+        if not csv_files:
+            print(f"  {folder_name}: no CSV files, skipped")
+            continue
+
+        fingerprint = input_fingerprint(csv_files)
+        if not force and summary_is_current(folder_name, fingerprint, results_path):
+            print(f"  {folder_name}: unchanged, skipped")
+            continue
+        pending.append((folder_path, csv_files, results_path, fingerprint))
+
+    written = []
+    if not pending:
+        print("All summaries are up to date.")
+        return written
+
+    print(f"Generating {len(pending)} summaries...")
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(generate_day_summary, *job): job for job in pending}
+        for future in as_completed(futures):
+            folder_path = futures[future][0]
+            try:
+                folder_name, output_file, unique_points = future.result()
+                print(f"  {folder_name}: {unique_points} unique points -> {output_file}")
+                written.append(output_file)
+            except Exception as e:
+                print(f"  Error summarizing {folder_path}: {e}")
+
+    return sorted(written)
+
+def main():
+    """Main function to run the script"""
+    print("Daily Mission Summary Generator")
+    print("=" * 50)
+
+    force = '--force' in sys.argv[1:]
+    written = generate_daily_summaries(os.getcwd(), force=force)
+
+    print(f"\nSummaries written: {len(written)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Robot Path Analysis
+Reconstructs the robot's travel path from rover positions and measures how
+efficiently it moved between survey points.
+"""
+
+import pandas as pd
+import numpy as np
+import sys
+
+EARTH_RADIUS_FT = 20902231.0
+ROVER_COLUMNS = ['roverPositionLongitude', 'roverPositionLatitude']
+
+def project_to_feet(lon, lat):
+    """
+    Project longitude/latitude onto a local flat plane in feet.
+
+    An equirectangular projection around the mean latitude is accurate to well
+    under a foot over a survey site and keeps every distance a plain vector op.
+    """
+    lat0 = np.radians(np.nanmean(lat))
+    x = np.radians(lon) * np.cos(lat0) * EARTH_RADIUS_FT
+    y = np.radians(lat) * EARTH_RADIUS_FT
+    return x, y
+
+def split_sessions(df, max_gap_minutes=30):
+    """
+    Order points by time and assign a session number to each.
+
+    A new session starts whenever consecutive points are more than
+    max_gap_minutes apart, so overnight breaks always split sessions.
+
+    Args:
+        df (pd.DataFrame): Points with a 'time' column
+        max_gap_minutes (int): Largest pause still counted as one session
+
+    Returns:
+        pd.DataFrame: Copy of df sorted by time with 'datetime' and 'session' columns
+    """
+    ordered = df.copy()
+    ordered['datetime'] = pd.to_datetime(ordered['time'])
+    ordered = ordered.sort_values('datetime', kind='stable').reset_index(drop=True)
+
+    gaps = ordered['datetime'].diff() > pd.Timedelta(minutes=max_gap_minutes)
+    ordered['session'] = gaps.cumsum().astype(int) + 1
+    return ordered
+
+def analyze_paths(df, max_gap_minutes=30, detour_factor=3.0, backtrack_angle=150.0):
+    """
+    Reconstruct robot paths and compute travel-efficiency metrics.
+
+    Every step after the time sort is a vectorized pass over the points.
+    The minimal path for a session is one median point spacing per move, so
+    efficiency shows how much extra driving the robot did between points.
+
+    Args:
+        df (pd.DataFrame): Points with 'time' and rover position columns
+        max_gap_minutes (int): Largest pause still counted as one session
+        detour_factor (float): Legs longer than this multiple of the session's
+            median leg are long legs, flagged as detours or backtracking
+        backtrack_angle (float): Long legs turning sharper than this many
+            degrees from the previous leg are backtracking; the rest are detours
+
+    Returns:
+        tuple: (legs DataFrame with one row per move, sessions DataFrame)
+    """
+    ordered = split_sessions(df, max_gap_minutes)
+    x, y = project_to_feet(ordered[ROVER_COLUMNS[0]].to_numpy(dtype=float),
+                           ordered[ROVER_COLUMNS[1]].to_numpy(dtype=float))
+    session = ordered['session'].to_numpy()
+    seconds = (ordered['datetime'] - ordered['datetime'].iloc[0]).dt.total_seconds().to_numpy()
+
+    # A leg joins two consecutive points in the same session
+    dx = np.diff(x)
+    dy = np.diff(y)
+    same_session = session[1:] == session[:-1]
+    distance = np.hypot(dx, dy)
+    elapsed = np.diff(seconds)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        speed = np.where(elapsed > 0, distance / elapsed, np.nan)
+
+    legs = pd.DataFrame({
+        'session': session[1:],
+        'from_name': ordered['name'].to_numpy()[:-1],
+        'to_name': ordered['name'].to_numpy()[1:],
+        'start_time': ordered['datetime'].to_numpy()[:-1],
+        'distance_ft': distance,
+        'elapsed_s': elapsed,
+        'speed_ftps': speed,
+    })[same_session].reset_index(drop=True)
+
+    # Heading change between a leg and the one before it in the same session
+    heading = np.degrees(np.arctan2(dy, dx))[same_session]
+    turn = np.abs((np.diff(heading) + 180.0) % 360.0 - 180.0)
+    continues = legs['session'].to_numpy()[1:] == legs['session'].to_numpy()[:-1]
+    legs['turn_deg'] = np.concatenate([[np.nan], np.where(continues, turn, np.nan)])
+
+    median_leg = legs.groupby('session')['distance_ft'].transform('median')
+    long_leg = legs['distance_ft'] > detour_factor * median_leg
+    reverses = legs['turn_deg'] > backtrack_angle
+    legs['detour'] = long_leg & ~reverses
+    legs['backtrack'] = long_leg & reverses
+
+    sessions = legs.groupby('session').agg(
+        traveled_ft=('distance_ft', 'sum'),
+        median_leg_ft=('distance_ft', 'median'),
+        median_speed_ftps=('speed_ftps', 'median'),
+        detours=('detour', 'sum'),
+        backtracks=('backtrack', 'sum'),
+    )
+    bounds = ordered.groupby('session').agg(
+        start=('datetime', 'min'),
+        end=('datetime', 'max'),
+        points=('datetime', 'count'),
+    )
+    sessions = bounds.join(sessions, how='left').fillna({
+        'traveled_ft': 0.0, 'median_leg_ft': 0.0, 'detours': 0, 'backtracks': 0,
+    })
+
+    sessions['minimal_ft'] = (sessions['points'] - 1) * sessions['median_leg_ft']
+    efficiency = (sessions['minimal_ft'] / sessions['traveled_ft'].where(sessions['traveled_ft'] > 0)).clip(upper=1.0) * 100
+    sessions['efficiency_pct'] = efficiency
+    sessions['detours'] = sessions['detours'].astype(int)
+    sessions['backtracks'] = sessions['backtracks'].astype(int)
+
+    return legs, sessions
+
+def print_path_summary(sessions):
+    """Print one line per session with travel distance and efficiency."""
+    for session_id, stats in sessions.iterrows():
+        efficiency = f"{stats['efficiency_pct']:.0f}%" if pd.notna(stats['efficiency_pct']) else "N/A"
+        print(f"Session {session_id} ({stats['start'].strftime('%Y-%m-%d %H:%M')} - {stats['end'].strftime('%H:%M')}): "
+              f"{int(stats['points'])} points, {stats['traveled_ft']:,.0f} ft traveled, "
+              f"efficiency {efficiency}, {stats['detours']} detours, {stats['backtracks']} backtracks")
+
+def main():
+    """Main function to run the script"""
+    print("Robot Path Analysis")
+    print("=" * 50)
+
+    input_file = sys.argv[1] if len(sys.argv) > 1 else './results/Combined_Mission_Data_All_Days_Sep26_2025.csv'
+    df = pd.read_csv(input_file, comment='#')
+    print(f"Loaded {len(df)} points from {input_file}")
+    print()
+
+    legs, sessions = analyze_paths(df)
+    print_path_summary(sessions)
+
+    flagged = legs[legs['detour'] | legs['backtrack']]
+    if len(flagged):
+        print()
+        print("FLAGGED LEGS:")
+        print("-" * 50)
+        for _, leg in flagged.iterrows():
+            reason = 'backtrack' if leg['backtrack'] else 'detour'
+            print(f"  {leg['from_name']} -> {leg['to_name']}: {leg['distance_ft']:.1f} ft ({reason})")
+
+    return legs, sessions
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Design Point Reconciliation
+Compares collected survey points against the planned design point list and
+reports missing, extra and repeated points, per-day completion and runs of
+uncollected design point numbers.
+"""
+
+import pandas as pd
+import numpy as np
+import glob
+import os
+import sys
+from datetime import datetime
+
+DESIGN_COORD_COLUMNS = [
+    ('originalLongitude', 'originalLatitude'),
+    ('longitude', 'latitude'),
+    ('lon', 'lat'),
+    ('x', 'y'),
+]
+
+def find_latest_combined_file(results_dir='results'):
+    """Return the most recently written all-days combined file, or None."""
+    files = glob.glob(os.path.join(results_dir, 'Combined_Mission_Data_All_Days_*.csv'))
+    if not files:
+        return None
+    return max(files, key=os.path.getmtime)
+
+def load_design_points(design_file):
+    """
+    Load the planned point list.
+
+    Only the name column (and coordinates, when present) is read, with names
+    kept as strings so that millions of rows load without type inference.
+
+    Args:
+        design_file (str): CSV with a 'name' column and optional coordinates
+
+    Returns:
+        pd.DataFrame: Design points with 'name' and optional 'longitude'/'latitude'
+    """
+    header = pd.read_csv(design_file, nrows=0).columns
+    if 'name' not in header:
+        raise ValueError(f"Design file {design_file} has no 'name' column")
+
+    usecols = ['name']
+    coord_pair = None
+    for lon_col, lat_col in DESIGN_COORD_COLUMNS:
+        if lon_col in header and lat_col in header:
+            coord_pair = (lon_col, lat_col)
+            usecols += [lon_col, lat_col]
+            break
+
+    design_df = pd.read_csv(design_file, usecols=usecols, dtype={'name': str})
+    design_df['name'] = design_df['name'].str.strip()
+    if coord_pair:
+        design_df = design_df.rename(columns={coord_pair[0]: 'longitude', coord_pair[1]: 'latitude'})
+
+    return design_df
+
+def load_collected_points(combined_file):
+    """Load collected points from a combined output, skipping the metadata header."""
+    collected_df = pd.read_csv(combined_file, comment='#', dtype={'name': str, 'id': str})
+    collected_df['name'] = collected_df['name'].str.strip()
+    return collected_df
+
+def find_number_runs(names):
+    """
+    Group numeric point names into runs of consecutive numbers.
+
+    The numbers are sorted and de-duplicated, and a run breaks wherever two
+    neighbours differ by more than one, so the cost grows with the number of
+    names rather than with the span of the numbering. Non-numeric names are
+    ignored.
+
+    Args:
+        names (pd.Series): Point names
+
+    Returns:
+        list: Inclusive (first, last) tuples, one per run
+    """
+    numbers = pd.to_numeric(names, errors='coerce').dropna()
+    numbers = np.unique(numbers[numbers == numbers.round()].astype(np.int64).to_numpy())
+    if len(numbers) == 0:
+        return []
+
+    breaks = np.flatnonzero(np.diff(numbers) != 1)
+    run_starts = numbers[np.r_[0, breaks + 1]]
+    run_ends = numbers[np.r_[breaks, len(numbers) - 1]]
+    return [(int(start), int(end)) for start, end in zip(run_starts, run_ends)]
+
+def reconcile_design_points(design_file, combined_file=None, output_to_results=True):
+    """
+    Reconcile collected points against a design point list.
+
+    Points are matched on 'name' with a hash join: the design names are built
+    into a hash index once and every collected name is probed against it.
+
+    Args:
+        design_file (str): Path to the design point CSV
+        combined_file (str): Combined mission data (default: latest all-days file)
+        output_to_results (bool): Whether to save the issue list to the results folder
+
+    Returns:
+        dict: Reconciliation summary, or None if inputs are missing
+    """
+    if combined_file is None:
+        combined_file = find_latest_combined_file()
+    if combined_file is None or not os.path.exists(combined_file):
+        print("No combined mission data found. Run combine_all_mission_data.py first.")
+        return None
+
+    print(f"Design file: {design_file}")
+    print(f"Collected data: {combined_file}")
+
+    design_df = load_design_points(design_file)
+    collected_df = load_collected_points(combined_file)
+    print(f"Loaded {len(design_df)} design points and {len(collected_df)} collected points")
+
+    design_dups = design_df['name'].duplicated().sum()
+    if design_dups:
+        print(f"Warning: design file lists {design_dups} point names more than once; using first occurrence")
+        design_df = design_df.drop_duplicates(subset=['name'], keep='first')
+
+    # Hash join: probe each collected name against the design index
+    design_index = pd.Index(design_df['name'])
+    match_positions = design_index.get_indexer(collected_df['name'])
+    collected_df['design_row'] = match_positions
+    in_design = match_positions >= 0
+
+    design_hit = np.zeros(len(design_index), dtype=bool)
+    design_hit[match_positions[in_design]] = True
+
+    missing_df = design_df[~design_hit]
+    extra_df = collected_df[~in_design]
+
+    name_counts = collected_df.loc[in_design, 'name'].value_counts()
+    repeated = name_counts[name_counts > 1]
+
+    total_design = len(design_df)
+    completed = int(design_hit.sum())
+    completion = (completed / total_design) * 100 if total_design else 0.0
+
+    print()
+    print("RECONCILIATION SUMMARY:")
+    print("-" * 50)
+    print(f"Design points: {total_design}")
+    print(f"Design points collected: {completed}")
+    print(f"Missing points: {len(missing_df)}")
+    print(f"Extra points (not in design): {len(extra_df)}")
+    print(f"Points collected more than once: {len(repeated)}")
+    print(f"Overall completion: {completion:.1f}%")
+
+    # Per-day completion counts each design point on the first day it was collected
+    daily_completion = pd.DataFrame(columns=['new_points', 'cumulative_points', 'completion_pct'])
+    if 'time' in collected_df.columns and completed:
+        matched = collected_df[in_design].copy()
+        matched['date'] = pd.to_datetime(matched['time']).dt.date
+        first_seen = matched.sort_values('time').drop_duplicates(subset=['design_row'], keep='first')
+        new_points = first_seen['date'].value_counts().sort_index()
+        daily_completion = pd.DataFrame({
+            'new_points': new_points,
+            'cumulative_points': new_points.cumsum(),
+        })
+        daily_completion['completion_pct'] = (daily_completion['cumulative_points'] / total_design) * 100
+
+        print()
+        print("COMPLETION BY DAY:")
+        print("-" * 50)
+        for date, stats in daily_completion.iterrows():
+            print(f"  {date}: {int(stats['new_points'])} new points, "
+                  f"{int(stats['cumulative_points'])} total ({stats['completion_pct']:.1f}%)")
+
+    # Gaps are runs of planned point numbers that were never collected
+    gaps = find_number_runs(missing_df['name'])
+    print()
+    print("POINT NUMBER GAPS:")
+    print("-" * 50)
+    if gaps:
+        gap_sizes = [end - start + 1 for start, end in gaps]
+        print(f"Runs of uncollected design point numbers: {len(gaps)} ({sum(gap_sizes)} points)")
+        largest = sorted(zip(gap_sizes, gaps), reverse=True)[:10]
+        for size, (start, end) in largest:
+            span = f"{start}" if start == end else f"{start} - {end}"
+            print(f"  {span} ({size} points)")
+    else:
+        print("No gaps in design point numbers.")
+
+    if len(repeated):
+        print()
+        print("POINTS COLLECTED MORE THAN ONCE:")
+        print("-" * 50)
+        for name, count in repeated.head(20).items():
+            print(f"  Point {name}: {count} times")
+        if len(repeated) > 20:
+            print(f"  ... and {len(repeated) - 20} more")
+
+    # Missing points keep their design coordinates so they can be located in the field
+    missing_issues = missing_df.assign(issue='missing', count=0)
+    issues = pd.concat([
+        missing_issues,
+        pd.DataFrame({'name': extra_df['name'], 'issue': 'extra', 'count': 1}),
+        pd.DataFrame({'name': repeated.index, 'issue': 'repeated', 'count': repeated.to_numpy()}),
+    ], ignore_index=True)
+
+    output_file = None
+    if output_to_results:
+        os.makedirs('results', exist_ok=True)
+        output_file = f'results/Design_Reconciliation_{datetime.now().strftime("%b%d_%Y")}.csv'
+        with open(output_file, 'w', newline='') as f:
+            f.write(f"# Design Point Reconciliation\n")
+            f.write(f"# Design File: {os.path.basename(design_file)}\n")
+            f.write(f"# Collected Data: {os.path.basename(combined_file)}\n")
+            f.write(f"# Completion: {completion:.1f}% ({completed} of {total_design})\n")
+            f.write(f"# Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            f.write("#\n")
+            issues.to_csv(f, index=False)
+        print(f"\nReconciliation issues saved to: {output_file}")
+
+    return {
+        'design_points': total_design,
+        'completed_points': completed,
+        'completion_pct': completion,
+        'missing': missing_df,
+        'extra': extra_df,
+        'repeated': repeated,
+        'daily_completion': daily_completion,
+        'gaps': gaps,
+        'output_file': output_file,
+    }
+
+def main():
+    """Main function to run the script"""
+    print("Design Point Reconciliation")
+    print("=" * 50)
+
+    if len(sys.argv) < 2:
+        print("Usage: python reconcile_design_points.py <design_points.csv> [combined_data.csv]")
+        return
+
+    design_file = sys.argv[1]
+    combined_file = sys.argv[2] if len(sys.argv) > 2 else None
+
+    if not os.path.exists(design_file):
+        print(f"Design file '{design_file}' not found.")
+        return
+
+    reconcile_design_points(design_file, combined_file)
+
+if __name__ == "__main__":
+    main()